@@ -0,0 +1,37 @@
+import os
+import subprocess
+import sys
+import time
+
+# Seconds `import myplots` may add on top of a bare interpreter start
+IMPORT_BUDGET = 0.05
+HEAVY_MODULES = ["numpy", "pandas", "matplotlib", "seaborn"]
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(code:str, repeat:int):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        times.append(time.perf_counter() - start)
+    return sorted(times)[len(times) // 2]
+
+
+def main(repeat:int = 7):
+    check = (
+        "import sys, myplots; "
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]; "
+        "sys.exit(f'eagerly imported: {loaded}' if loaded else 0)"
+    )
+    subprocess.run([sys.executable, "-c", check], cwd=ROOT, check=True)
+
+    bare = _run("pass", repeat)
+    cost = _run("import myplots", repeat) - bare
+    print(f"import myplots: {cost * 1000:.1f} ms (budget {IMPORT_BUDGET * 1000:.0f} ms)")
+    return 0 if cost <= IMPORT_BUDGET else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from myplots import _kde_fft
+
+
+def exact_kde(values, grid, bw, chunk:int = 100_000):
+    # Direct O(n * g) Gaussian sum, the reference the binned engine approximates
+    density = np.zeros_like(grid)
+    for start in range(0, len(values), chunk):
+        diff = (grid[None, :] - values[start:start + chunk, None]) / bw
+        density += np.exp(-0.5 * diff * diff).sum(axis=0)
+    return density / (len(values) * bw * np.sqrt(2 * np.pi))
+
+
+def main(sizes = (10**3, 10**4, 10**5, 10**6), gridsize:int = 512):
+    rng = np.random.default_rng(0)
+    print(f"{'rows':>10} {'exact s':>10} {'fft s':>10} {'speedup':>8} {'max err':>10} {'L1 err':>10}")
+    for n in sizes:
+        values = np.concatenate([rng.normal(0, 1, n // 2), rng.gamma(2, 2, n - n // 2)])
+
+        start = time.perf_counter()
+        grid, approx = _kde_fft(values, gridsize=gridsize)
+        fft_time = time.perf_counter() - start
+
+        bw = np.std(values, ddof=1) * n ** (-1 / 5)
+        start = time.perf_counter()
+        exact = exact_kde(values, grid, bw)
+        exact_time = time.perf_counter() - start
+
+        max_err = np.abs(approx - exact).max() / exact.max()
+        l1_err = np.abs(approx - exact).sum() * (grid[1] - grid[0])
+        print(f"{n:>10} {exact_time:>10.4f} {fft_time:>10.4f} {exact_time / fft_time:>8.1f} "
+              f"{max_err:>10.2e} {l1_err:>10.2e}")
+
+
+if __name__ == "__main__":
+    main()
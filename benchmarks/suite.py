@@ -0,0 +1,191 @@
+import argparse
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SIZES = [10**3, 10**4, 10**5, 10**6, 10**7]
+HUES = {"low": 3, "high": 200}
+
+# Relative slowdown (and absolute floor in seconds / MB) that counts as a regression
+TIME_TOLERANCE, TIME_FLOOR = 0.25, 0.05
+RSS_TOLERANCE, RSS_FLOOR = 0.25, 20.0
+
+
+def make_frame(rows:int, levels:int, seed:int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    codes = rng.integers(0, levels, rows)
+    names = np.array([f"g{i:03d}" for i in range(levels)], dtype=object)
+    x = rng.normal(size=rows)
+    return pd.DataFrame({
+        "x": x,
+        "y": 0.5 * x + rng.normal(size=rows) + codes * 0.01,
+        "t": np.arange(rows, dtype=np.float64),
+        "value": rng.exponential(size=rows),
+        "cat": names[codes],
+    })
+
+
+def make_matrix(rows:int, seed:int = 0):
+    import numpy as np
+    import pandas as pd
+
+    side = max(2, min(int(rows ** 0.5), 4000))
+    return pd.DataFrame(np.random.default_rng(seed).normal(size=(side, side)).astype(np.float32))
+
+
+# name -> (data kind, call); each call returns the figure it drew
+CASES = {
+    "featureplot": ("vector", lambda mp, d: mp.featureplot(d["names"], d["values"], top_k=30)),
+    "heatmap": ("matrix", lambda mp, d: mp.heatmap(d)),
+    "scatterplot": ("frame", lambda mp, d: mp.scatterplot(d, "x", "y", "cat", mode="scatter")),
+    "scatterplot[density]": ("frame", lambda mp, d: mp.scatterplot(d, "x", "y", "cat", mode="density")),
+    "lineplot": ("frame", lambda mp, d: mp.lineplot(d, "t", "y", "cat")),
+    "lineplot[lttb]": ("frame", lambda mp, d: mp.lineplot(d, "t", "y", "cat", downsample=2000, errorbar=None)),
+    "stripplot": ("frame", lambda mp, d: mp.stripplot(d, "cat", "y", "cat")),
+    "violinplot": ("frame", lambda mp, d: mp.violinplot(d, "cat", "y", "cat", addstrip=False)),
+    "violinplot[fft]": ("frame", lambda mp, d: mp.violinplot(d, "cat", "y", "cat", strip_max_points=2000, kde_engine="fft")),
+    "boxplot": ("frame", lambda mp, d: mp.boxplot(d, "cat", "y", "cat", addstrip=False)),
+    "histplot": ("frame", lambda mp, d: mp.histplot(d, "x", "cat")),
+    "histplot[fft]": ("frame", lambda mp, d: mp.histplot(d, "x", "cat", kde=True, kde_engine="fft")),
+    "pieplot": ("frame", lambda mp, d: mp.pieplot(d.groupby("cat", as_index=False)["value"].sum(), "cat", "value", "cat", top_n=20)),
+    "barplot": ("frame", lambda mp, d: mp.barplot(d, "cat", "value", "cat")),
+}
+
+
+def _run_case(args):
+    # Runs in a fresh process so ru_maxrss is this case's own peak
+    import resource
+
+    import matplotlib
+    matplotlib.use("Agg")
+    import numpy as np
+    import myplots as mp
+
+    name, rows, hue = args
+    kind, call = CASES[name]
+    if kind == "frame":
+        data = make_frame(rows, HUES[hue])
+    elif kind == "matrix":
+        data = make_matrix(rows)
+    else:
+        data = {"names": np.array([f"f{i}" for i in range(rows)]), "values": np.random.default_rng(0).exponential(size=rows)}
+
+    # Deferred seaborn/pyplot import, ggplot setup and font loading happen on the
+    # first plot call; pay for them before the clock starts
+    mp.sns._load()
+    warm, _ = mp.plt.subplots()
+    warm.savefig(io.BytesIO())
+    mp.plt.close(warm)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "plot.png")
+        start = time.perf_counter()
+        fig, _ = call(mp, data)
+        drawn = time.perf_counter()
+        fig.savefig(path)
+        saved = time.perf_counter()
+        size = os.path.getsize(path)
+
+    return {
+        "case": name,
+        "rows": rows,
+        "hue": hue,
+        "draw": drawn - start,
+        "save": saved - drawn,
+        "time": saved - start,
+        "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "bytes": size,
+    }
+
+
+def _key(result):
+    return f"{result['case']}|{result['rows']}|{result['hue']}"
+
+
+def compare(results, baseline):
+    regressions = []
+    for result in results:
+        old = baseline.get(_key(result))
+        if old is None:
+            continue
+        slower = result["time"] - old["time"]
+        if slower > TIME_FLOOR and slower > TIME_TOLERANCE * old["time"]:
+            regressions.append((_key(result), "time", old["time"], result["time"]))
+        grown = result["rss_mb"] - old["rss_mb"]
+        if grown > RSS_FLOOR and grown > RSS_TOLERANCE * old["rss_mb"]:
+            regressions.append((_key(result), "rss_mb", old["rss_mb"], result["rss_mb"]))
+    return regressions
+
+
+def main(argv=None):
+    import multiprocessing
+
+    parser = argparse.ArgumentParser(description="Benchmark every myplots function across data sizes.")
+    parser.add_argument("--cases", nargs="*", default=list(CASES), choices=list(CASES))
+    parser.add_argument("--max-rows", type=int, default=SIZES[-1])
+    parser.add_argument("--hues", nargs="*", default=list(HUES), choices=list(HUES))
+    parser.add_argument("--baseline", default=os.path.join(ROOT, "benchmarks", "baseline.json"))
+    parser.add_argument("--update", action="store_true", help="overwrite the baseline with this run")
+    parser.add_argument("--output", help="also write this run's results as JSON lines")
+    args = parser.parse_args(argv)
+
+    # Without a baseline there is nothing to compare against; fail instead of
+    # reporting "no regressions"
+    if not args.update and not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; run with --update to record one", file=sys.stderr)
+        return 2
+
+    jobs = [
+        (name, rows, hue)
+        for name in args.cases
+        for rows in SIZES if rows <= args.max_rows
+        for hue in (args.hues if CASES[name][0] == "frame" else ["low"])
+    ]
+
+    results = []
+    ctx = multiprocessing.get_context("spawn")
+    print(f"{'case':<22} {'rows':>9} {'hue':>5} {'time s':>9} {'draw s':>9} {'rss MB':>8} {'KB':>8}")
+    with ctx.Pool(1, maxtasksperchild=1) as pool:
+        for result in pool.imap(_run_case, jobs):
+            results.append(result)
+            print(f"{result['case']:<22} {result['rows']:>9} {result['hue']:>5} {result['time']:>9.3f} "
+                  f"{result['draw']:>9.3f} {result['rss_mb']:>8.1f} {result['bytes'] / 1024:>8.1f}", flush=True)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    if args.update:
+        baseline.update({_key(r): r for r in results})
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=1, sort_keys=True)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    missing = [_key(r) for r in results if _key(r) not in baseline]
+    if missing:
+        print(f"WARNING {len(missing)} results have no baseline entry and were not compared: "
+              + ", ".join(missing), file=sys.stderr)
+    regressions = compare(results, baseline)
+    for key, metric, old, new in regressions:
+        print(f"REGRESSION {key} {metric}: {old:.3f} -> {new:.3f}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
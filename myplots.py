@@ -1,18 +1,67 @@
-import numpy as np
-import pandas as pd
+from __future__ import annotations
 
-from typing import Tuple, Dict, List
+__version__ = "0.2.0"
 
-import seaborn as sns
-import matplotlib as mpl
-import matplotlib.pyplot as plt
+import importlib
+import sys
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Tuple, Dict, List, TYPE_CHECKING
 
-# Set global configuration
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Heavy backends are imported on first use so `import myplots` stays cheap
+
+class _LazyModule:
+    def __init__(self, name:str, setup = None):
+        self._name = name
+        self._setup = setup
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+            if self._setup is not None:
+                self._setup()
+        return self._module
+
+    def __getattr__(self, attr:str):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+def _configure():
+    if _configure.done:
+        return
+    _configure.done = True
+    overrides = dict(plt.style.library["ggplot"])
+    font = _get_font()
+    if font is not None:
+        overrides['font.family'] = font
+    overrides['axes.unicode_minus'] = False
+    # Only restyle keys the user has not set since myplots (or matplotlib) was imported
+    base = mpl.rcParamsOrig if _RC_SNAPSHOT is None else _RC_SNAPSHOT
+    mpl.rcParams.update({
+        k: v for k, v in overrides.items()
+        if k in base and mpl.rcParams[k] == base[k]
+    })
+_configure.done = False
 
-mpl.rcParams['font.family'] = 'Malgun Gothic'
-mpl.rcParams['axes.unicode_minus'] = False
+# rcParams as the user had them when myplots was imported; if matplotlib comes in
+# later, rcParamsOrig (the rc file values it starts from) plays the same role
+_RC_SNAPSHOT = sys.modules["matplotlib"].rcParams.copy() if "matplotlib" in sys.modules else None
 
-plt.style.use("ggplot")
+np = _LazyModule("numpy")
+pd = _LazyModule("pandas")
+mpl = _LazyModule("matplotlib")
+plt = _LazyModule("matplotlib.pyplot", _configure)
+sns = _LazyModule("seaborn", _configure)
+
+# Set global configuration
+
+_FONTS = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR", "Noto Sans KR"]
 
 # Set global constants
 
@@ -24,13 +73,139 @@ _COLORS = [
     ["#77BEF0", "#FFCB61", "#FF894F", "#EA5B6F"],
 ]
 
+# Rows above which scatterplot(mode="auto") switches to the density grid
+_DENSITY_ROWS = 1_000_000
+# Rows converted to NumPy at a time when binning large frames
+_CHUNK_ROWS = 1_000_000
+
+###################
+# Instrumentation #
+###################
+
+# Records of the active instrument() block, or None when not instrumenting
+_RECORDS = None
+# Record of the outermost plot call in progress and its open phase frames
+_ACTIVE = None
+_PHASES = []
+
+@contextmanager
+def instrument(path:str = None, memory:bool = True):
+    # Collect one record per plot call (wall time and tracemalloc peak per
+    # phase, row count, hue cardinality); optionally append them to `path`
+    # as JSON lines when the block exits
+    import tracemalloc
+    global _RECORDS
+
+    records, previous = [], _RECORDS
+    started = memory and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    _RECORDS = records
+    try:
+        yield records
+    finally:
+        _RECORDS = previous
+        if started:
+            tracemalloc.stop()
+        if previous is not None:
+            previous.extend(records)
+        if path is not None:
+            import json
+            with open(path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+@contextmanager
+def _phase(name:str):
+    if _ACTIVE is None:
+        yield
+        return
+    import time
+    import tracemalloc
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        current, peak = tracemalloc.get_traced_memory()
+        if _PHASES:
+            _PHASES[-1]["peak"] = max(_PHASES[-1]["peak"], peak)
+        tracemalloc.reset_peak()
+    frame = {"start": current if tracing else 0, "peak": 0}
+    _PHASES.append(frame)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        _PHASES.pop()
+        peak = 0
+        if tracing:
+            peak = max(frame["peak"], tracemalloc.get_traced_memory()[1])
+            if _PHASES:
+                _PHASES[-1]["peak"] = max(_PHASES[-1]["peak"], peak)
+            tracemalloc.reset_peak()
+        phase = _ACTIVE["phases"].setdefault(name, {"time": 0.0, "peak": 0, "calls": 0})
+        phase["time"] += elapsed
+        phase["peak"] = max(phase["peak"], peak - frame["start"])
+        phase["calls"] += 1
+
+@contextmanager
+def _record(plot:str, df = None, hue:str = None):
+    global _ACTIVE
+    if _RECORDS is None or _ACTIVE is not None:
+        yield
+        return
+    import time
+
+    _ACTIVE = {
+        "plot": plot,
+        "started": time.time(),
+        "rows": len(df) if isinstance(df, pd.DataFrame) else None,
+        "hue": hue,
+        "hue_levels": None,
+        "phases": {},
+    }
+    record = _ACTIVE
+    try:
+        with _phase("total"):
+            yield
+    finally:
+        _ACTIVE = None
+        total = record["phases"].pop("total")
+        record["time"], record["peak"] = total["time"], total["peak"]
+        measured = sum(p["time"] for p in record["phases"].values())
+        record["phases"]["draw"] = {"time": max(total["time"] - measured, 0.0)}
+        _RECORDS.append(record)
+
+def _instrumented(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if _RECORDS is None:
+            return func(*args, **kwargs)
+        import inspect
+        arguments = inspect.signature(func).bind_partial(*args, **kwargs).arguments
+        with _record(func.__name__, arguments.get("df"), arguments.get("hue")):
+            return func(*args, **kwargs)
+    return wrapper
+
+def _timed(name:str):
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _ACTIVE is None:
+                return func(*args, **kwargs)
+            with _phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 #############
 # Draw plot #
 #############
 
+@_instrumented
 def featureplot(
         feature_name,
-        feature_value,
+        feature_value = None,
         figsize:Tuple[int] = (10, 6),
         fig = None,
         axe = None,
@@ -38,9 +213,23 @@ def featureplot(
         title:str = None,
         xlabel:str = None,
         ylabel:str = None,
-        legend:bool = True
+        legend:bool = True,
+        top_k:int = None,
+        addrest:bool = False,
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    feature_name, feature_value = _get_features(feature_name, feature_value)
+
+    if top_k is not None and top_k < len(feature_value):
+        # argpartition is O(n); only the k survivors get fully sorted
+        magnitude = -np.abs(feature_value)
+        top = np.argpartition(magnitude, top_k - 1)[:top_k]
+        top = top[np.argsort(magnitude[top], kind="stable")]
+        rest = feature_value.sum() - feature_value[top].sum()
+        feature_name, feature_value = feature_name[top], feature_value[top]
+        if addrest:
+            feature_name = np.append(feature_name, f"rest ({len(magnitude) - top_k})")
+            feature_value = np.append(feature_value, rest)
     
     sns.barplot(
         x=feature_value,
@@ -54,6 +243,7 @@ def featureplot(
 
     return fig, axe
 
+@_instrumented
 def heatmap(
         df:pd.DataFrame,
         figsize:Tuple[int] = (10, 6),
@@ -64,19 +254,33 @@ def heatmap(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        maxcells:int = 1000,
+        pooling:str = "mean",
+        order = None,
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
-    
-    sns.heatmap(
-        data=df,
-        ax=axe,    
-    )
+    df = _as_frame(df)
+
+    # df may also be a NumPy array / memmap or the path of a .npy file; these
+    # and frames larger than maxcells are block-pooled down before drawing.
+    # order (e.g. from corrmatrix) permutes rows and columns while drawing.
+    if isinstance(df, str):
+        df = np.load(df, mmap_mode="r")
+
+    if isinstance(df, pd.DataFrame) and max(df.shape) <= maxcells:
+        sns.heatmap(
+            data=df if order is None else df.iloc[order, order],
+            ax=axe,    
+        )
+    else:
+        _draw_pooled_heatmap(fig, axe, df, maxcells, pooling, order)
 
     axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
 
     return fig, axe
 
 
+@_instrumented
 def scatterplot(
         df:pd.DataFrame,
         x:str,
@@ -92,30 +296,49 @@ def scatterplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        mode:str = "auto",
+        gridsize:int = 512,
+        linehue:bool = False,
+        linestats = None,
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
     hue_order, palette = _get_palette(df, hue, palette)
-    
-    sns.scatterplot(
-        data=df,
-        x=x,
-        y=y, 
-        hue=hue,
-        hue_order=hue_order,
-        ax=axe,
-        palette=palette,        
-    )
+
+    if mode == "auto":
+        mode = "density" if len(df) > _DENSITY_ROWS else "scatter"
+    if mode == "density":
+        _draw_density(axe, df, x, y, hue, hue_order, palette, gridsize)
+    elif mode == "scatter":
+        sns.scatterplot(
+            data=df,
+            x=x,
+            y=y, 
+            hue=hue,
+            hue_order=hue_order,
+            ax=axe,
+            palette=palette,        
+        )
+    else:
+        raise ValueError(f"mode must be 'auto', 'scatter' or 'density', got {mode!r}")
 
     if addline:
-        from sklearn.linear_model import LinearRegression
-        lm = LinearRegression()
-        lm.fit(df["X"].values.reshape(-1, 1), df["Y"].values.reshape(-1, 1))
-        axe.axline((0, lm.intercept_[0]), slope=lm.coef_[0][0])
+        linehue = linehue and hue is not None
+        if linestats is None:
+            linestats = linefit_stats(df, x, y, hue if linehue else None, hue_order)
+        slopes, intercepts = _solve_linefit(linestats)
+        levels = hue_order if linehue else [None]
+        for level, slope, intercept in zip(levels, slopes, intercepts):
+            if np.isnan(slope):
+                continue
+            color = None if level is None else palette[level]
+            axe.axline((0, intercept), slope=slope, color=color)
 
     axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
 
     return fig, axe
 
+@_instrumented
 def lineplot(
         df:pd.DataFrame,
         x:str,
@@ -130,9 +353,16 @@ def lineplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        downsample:int = None,
+        downsample_method:str = "lttb",
+        errorbar = ("ci", 95),
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
     hue_order, palette = _get_palette(df, hue, palette)
+
+    if downsample is not None:
+        df = _downsample_series(df, x, y, hue, hue_order, downsample, downsample_method)
     
     sns.lineplot(
         data=df,
@@ -142,12 +372,14 @@ def lineplot(
         hue_order=hue_order,
         ax=axe,
         color=palette,        
+        errorbar=errorbar,
     )
 
     axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
 
     return fig, axe
 
+@_instrumented
 def stripplot(
         df:pd.DataFrame,
         x:str,
@@ -164,6 +396,7 @@ def stripplot(
         legend:bool = True,
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
     hue_order, palette = _get_palette(df, hue, palette)
 
     sns.stripplot(
@@ -181,6 +414,7 @@ def stripplot(
     return fig, axe
 
 
+@_instrumented
 def violinplot(
         df:pd.DataFrame,
         x:str,
@@ -196,25 +430,34 @@ def violinplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        strip_max_points:int = None,
+        kde_engine:str = "exact",
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
     hue_order, palette = _get_palette(df, hue, palette)
     
-    violin = sns.violinplot(
-        data=df,
-        x=x,
-        y=y, 
-        hue=hue,
-        width=0.5,
-        dodge=False,
-        ax=axe,
-        palette=palette,
-        inner='box',
-        linewidth=0.5,
-    )
+    if kde_engine == "fft":
+        violin = _draw_violins(axe, df, x, y, hue, hue_order, palette, width=0.5)
+    elif kde_engine == "exact":
+        violin = sns.violinplot(
+            data=df,
+            x=x,
+            y=y, 
+            hue=hue,
+            width=0.5,
+            dodge=False,
+            ax=axe,
+            palette=palette,
+            inner='box',
+            linewidth=0.5,
+        )
+    else:
+        raise ValueError(f"kde_engine must be 'exact' or 'fft', got {kde_engine!r}")
     if addstrip:
         from matplotlib.collections import PolyCollection
-        _, axe = stripplot(df, x, y, hue, figsize, fig, axe, fs, palette, legend=False)
+        strip_df = _sample_groups(df, [x, hue], strip_max_points)
+        _, axe = stripplot(strip_df, x, y, hue, figsize, fig, axe, fs, palette, legend=False)
         for patch in violin.collections:
                 if isinstance(patch, PolyCollection):
                     patch.set_alpha(0.6)
@@ -225,6 +468,7 @@ def violinplot(
     return fig, axe
 
 
+@_instrumented
 def boxplot(
         df:pd.DataFrame,
         x:str,
@@ -240,8 +484,19 @@ def boxplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        strip_max_points:int = None,
+        stats:Dict = None,
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
+
+    # stats maps each x level to a QuantileSketch (see boxstats) or to a
+    # matplotlib bxp dict (med, q1, q3, whislo, whishi); df is then optional
+    if stats is not None:
+        _draw_bxp(axe, stats, x if hue is None else hue, palette)
+        axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
+        return fig, axe
+
     hue_order, palette = _get_palette(df, hue, palette)
     
     box = sns.boxplot(
@@ -257,7 +512,8 @@ def boxplot(
         linewidth=0.5,
     )
     if addstrip:
-        _, axe = stripplot(df, x, y, hue, figsize, fig, axe, fs, palette, legend=False)
+        strip_df = _sample_groups(df, [x, hue], strip_max_points)
+        _, axe = stripplot(strip_df, x, y, hue, figsize, fig, axe, fs, palette, legend=False)
         for patch in box.patches:
             patch.set_alpha(0.6)
 
@@ -265,6 +521,7 @@ def boxplot(
 
     return fig, axe
 
+@_instrumented
 def histplot(
         df:pd.DataFrame,
         x:str,
@@ -280,8 +537,33 @@ def histplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        binrange:Tuple[float] = None,
+        kde_engine:str = "exact",
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, hue)
+    if kde_engine not in ("exact", "fft"):
+        raise ValueError(f"kde_engine must be 'exact' or 'fft', got {kde_engine!r}")
+
+    # df may also be an iterator of DataFrame chunks (e.g. read_csv(chunksize=...))
+    # or a callable returning a fresh one, which allows a first pass for binrange
+    if not isinstance(df, pd.DataFrame):
+        edges, counts = _stream_histogram(df, x, hue, bins, binrange)
+        hue_order, palette = _draw_histogram(axe, edges, counts, hue, palette)
+        if kde:
+            # Only the binned counts survive streaming, so smooth those
+            centers = (edges[:-1] + edges[1:]) / 2
+            for level in hue_order:
+                # All-NaN or out-of-range levels bin nothing; seaborn's
+                # histplot KDE stops at the data range, hence cut=0
+                if counts[level].sum() < 2:
+                    continue
+                grid, density = _kde_fft(centers, counts[level], cut=0)
+                scale = counts[level].sum() * np.diff(edges).mean()
+                axe.plot(grid, density * scale, color=palette[level])
+        axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
+        return fig, axe
+
     hue_order, palette = _get_palette(df, hue, palette)
 
     sns.histplot(
@@ -292,12 +574,25 @@ def histplot(
         ax=axe, 
         palette=palette,
         bins=bins, 
-        kde=kde
+        binrange=binrange,
+        kde=kde and kde_engine == "exact"
     )
+    if kde and kde_engine == "fft":
+        values = df[x].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = _get_codes(df, hue, hue_order)
+        edges = np.histogram_bin_edges(values[np.isfinite(values)], bins=bins, range=binrange)
+        for k, level in enumerate([None] if hue is None else hue_order):
+            group = values[(codes == k) & np.isfinite(values)]
+            if len(group) < 2:
+                continue
+            grid, density = _kde_fft(group, cut=0)
+            color = None if level is None else palette[level]
+            axe.plot(grid, density * len(group) * np.diff(edges).mean(), color=color)
     axe = _set_label_layout(axe, fs, title, xlabel, ylabel, legend)
 
     return fig, axe
 
+@_instrumented
 def pieplot(
         df:pd.DataFrame,
         x:str,
@@ -313,8 +608,13 @@ def pieplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        top_n:int = None,
+        other:str = "other",
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
+    if top_n is not None:
+        df, palette = _top_levels(df, x, y, hue, top_n, other, palette)
     _, palette = _get_palette(df, hue, palette)
     linewidth = figsize[0] * figsize[1] // 20
 
@@ -343,6 +643,7 @@ def pieplot(
  
     return fig, axe
 
+@_instrumented
 def barplot(
         df:pd.DataFrame,
         x:str,
@@ -358,11 +659,16 @@ def barplot(
         xlabel:str = None,
         ylabel:str = None,
         legend:bool = True,
+        top_n:int = None,
+        other:str = "other",
     ):
     fig, axe, fs = _get_baseplot(figsize, fig, axe, fs)
+    df = _as_frame(df, x, y, hue)
+    if top_n is not None:
+        df, palette = _top_levels(df, x, y, hue, top_n, other, palette, estimator="mean")
     hue_order, palette = _get_palette(df, hue, palette)
 
-    max_label_len = max([len(lab) for lab in hue_order])
+    max_label_len = max([len(str(lab)) for lab in hue_order])
 
     sns.barplot(
         data=df, 
@@ -376,8 +682,8 @@ def barplot(
         palette=palette,
     )
     if addtext:
-        for i, value in enumerate(df[y]):
-            axe.text(i, value, f"{value:.4f}", ha="center", va="bottom", fontsize=fs['label'])
+        for bars in axe.containers:
+            axe.bar_label(bars, fmt="%.4f", fontsize=fs['label'])
     if max_label_len > 6:
         axe.tick_params(axis='x', rotation=90)
 
@@ -385,6 +691,100 @@ def barplot(
 
     return fig, axe
 
+def linefit_stats(
+        df:pd.DataFrame,
+        x:str,
+        y:str,
+        hue:str = None,
+        hue_order:List = None,
+        stats = None,
+    ):
+    # Running sums (n, sum x, sum y, sum xy, sum xx) per hue level; pass the
+    # returned array back in as `stats` to accumulate chunk by chunk.
+    df = _as_frame(df, x, y, hue)
+    if hue is not None and hue_order is None:
+        if stats is not None:
+            raise ValueError("hue_order is required when accumulating stats over chunks")
+        hue_order = sorted(df[hue].dropna().unique())
+    ncodes = 1 if hue is None else len(hue_order)
+    if stats is None:
+        stats = np.zeros((ncodes, 5), dtype=np.float64)
+
+    for start in range(0, len(df), _CHUNK_ROWS):
+        stop = start + _CHUNK_ROWS
+        xv = df[x].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+        yv = df[y].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = _get_codes(df, hue, hue_order, start, stop)
+        valid = np.isfinite(xv) & np.isfinite(yv) & (codes >= 0)
+        xv, yv, codes = xv[valid], yv[valid], codes[valid]
+
+        for k, weights in enumerate((None, xv, yv, xv * yv, xv * xv)):
+            stats[:, k] += np.bincount(codes, weights=weights, minlength=ncodes)
+    return stats
+
+def corrmatrix(
+        df:pd.DataFrame,
+        method:str = "pearson",
+        columns:List[str] = None,
+        block:int = 512,
+        dtype:str = "float32",
+        n_jobs:int = None,
+        cluster:bool = True,
+    ):
+    # Correlation of the numeric columns computed as blocked Z.T @ Z matmuls
+    # over one standardized copy of the data; returns (corr, order) where
+    # order is the hierarchical-clustering leaf order to pass to heatmap
+    from concurrent.futures import ThreadPoolExecutor
+
+    if method not in ("pearson", "spearman"):
+        raise ValueError(f"method must be 'pearson' or 'spearman', got {method!r}")
+    df = _as_frame(df, *(columns or ()))
+    columns = list(df.select_dtypes("number").columns) if columns is None else list(columns)
+    data = df[columns].rank() if method == "spearman" else df[columns]
+    values = data.to_numpy(dtype=dtype, na_value=np.nan, copy=True)
+    nrow, ncol = values.shape
+
+    # Standardize in place block by block; missing values become the mean (0)
+    starts = range(0, ncol, block)
+    for start in starts:
+        part = values[:, start:start + block]
+        part -= np.nanmean(part, axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            part /= np.sqrt(np.nansum(part * part, axis=0) / max(nrow - 1, 1))
+        np.nan_to_num(part, copy=False, nan=0.0)
+
+    corr = np.empty((ncol, ncol), dtype=dtype)
+    def fill(pair):
+        i, j = pair
+        prod = values[:, i:i + block].T @ values[:, j:j + block] / max(nrow - 1, 1)
+        corr[i:i + block, j:j + block] = prod
+        corr[j:j + block, i:i + block] = prod.T
+
+    pairs = [(i, j) for i in starts for j in starts if i <= j]
+    if n_jobs is None or n_jobs == 1:
+        for pair in pairs:
+            fill(pair)
+    else:
+        import os
+        with ThreadPoolExecutor(os.cpu_count() if n_jobs == -1 else n_jobs) as pool:
+            list(pool.map(fill, pairs))
+
+    constant = ~values.any(axis=0)
+    corr[constant, :] = np.nan
+    corr[:, constant] = np.nan
+    np.fill_diagonal(corr, 1.0)
+    corr = pd.DataFrame(corr, index=columns, columns=columns)
+
+    order = None
+    if cluster:
+        from scipy.cluster.hierarchy import linkage, leaves_list
+        from scipy.spatial.distance import squareform
+
+        dist = np.clip(1.0 - np.nan_to_num(corr.to_numpy(dtype=np.float64), nan=0.0), 0.0, 2.0)
+        np.fill_diagonal(dist, 0.0)
+        order = leaves_list(linkage(squareform(dist, checks=False), method="average"))
+    return corr, order
+
 def baseplot(
         figsize:Tuple[int] = (10, 6),
         fig = None,
@@ -395,6 +795,644 @@ def baseplot(
     ):
     return _get_baseplot(figsize, fig, axe, fs, nrow, ncol)
 
+###################
+# Quantile sketch #
+###################
+
+class QuantileSketch:
+    # Mergeable t-digest style summary: weighted centroids that are fine
+    # near the tails and coarse in the middle, so quartiles and whiskers can
+    # be estimated from bounded memory and combined across chunks/processes
+    def __init__(self, compression:int = 200):
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return self
+        self.count += len(values)
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._compress(
+            np.concatenate([self.means, values]),
+            np.concatenate([self.weights, np.ones(len(values))]),
+        )
+        return self
+
+    def merge(self, other:QuantileSketch):
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compress(
+            np.concatenate([self.means, other.means]),
+            np.concatenate([self.weights, other.weights]),
+        )
+        return self
+
+    def quantile(self, q):
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)
+        centers = np.cumsum(self.weights) - self.weights / 2
+        knots = np.r_[0, centers, self.count]
+        means = np.r_[self.min, self.means, self.max]
+        return np.interp(np.asarray(q) * self.count, knots, means)
+
+    def _compress(self, means, weights):
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        q = (np.cumsum(weights) - weights / 2) / total
+        # arcsine scale function: equal-width buckets in k are narrow in q at the tails
+        k = self.compression * (np.arcsin(2 * q - 1) / np.pi + 0.5)
+        bucket = np.minimum(k.astype(np.int64), self.compression - 1)
+        bucket = np.unique(bucket, return_inverse=True)[1]
+
+        self.weights = np.bincount(bucket, weights=weights)
+        self.means = np.bincount(bucket, weights=means * weights) / self.weights
+
+def boxstats(
+        df:pd.DataFrame,
+        x:str,
+        y:str,
+        sketches:Dict = None,
+        compression:int = 200,
+    ):
+    # Update (or create) one QuantileSketch per x level; call again per chunk
+    # and combine results from other processes with merge_boxstats
+    df = _as_frame(df, x, y)
+    sketches = {} if sketches is None else sketches
+    for level, values in df.groupby(x, observed=True)[y]:
+        if level not in sketches:
+            sketches[level] = QuantileSketch(compression)
+        sketches[level].update(values.to_numpy(dtype=np.float64, na_value=np.nan))
+    return sketches
+
+def merge_boxstats(*stats:Dict):
+    merged = {}
+    for sketches in stats:
+        for level, sketch in sketches.items():
+            if level not in merged:
+                merged[level] = QuantileSketch(sketch.compression)
+            merged[level].merge(sketch)
+    return merged
+
+######################
+# Streaming lineplot #
+######################
+
+class StreamingLineplot:
+    # Live lineplot for monitoring: one Line2D per hue level fed from a
+    # fixed-size ring buffer of the last `window` points. update(chunk) only
+    # touches the new rows and blits the lines over a cached background; the
+    # full figure is redrawn only when points leave the current limits or a
+    # new hue level shows up. With set_figure_pool on, pass your own fig/axe
+    # so the pool cannot hand this figure to another plot.
+    def __init__(
+            self,
+            x:str,
+            y:str,
+            hue:str = None,
+            window:int = 10_000,
+            hue_order:List = None,
+            figsize:Tuple[int] = (10, 6),
+            fig = None,
+            axe = None,
+            fs = None,
+            palette = None,
+            title:str = None,
+            xlabel:str = None,
+            ylabel:str = None,
+            legend:bool = True,
+        ):
+        self.fig, self.axe, self.fs = _get_baseplot(figsize, fig, axe, fs)
+        self.x, self.y, self.hue, self.window = x, y, hue, window
+        self.labels = (title, xlabel, ylabel, legend)
+        self.palette = {} if palette is None else dict(palette)
+        # Levels not known up front draw from the full colour set
+        self._colors = _get_colors(len(hue_order) if hue_order is not None else len(_COLORS) * len(_COLORS[0]))
+        self.lines = {}
+        self._buffers = {}
+        self._dates = None
+        self._xlim = self._ylim = None
+        self._background = None
+        self.fig.canvas.mpl_connect("draw_event", self._on_draw)
+
+        for level in (hue_order if hue_order is not None else []):
+            self._add_level(level)
+        _set_label_layout(self.axe, self.fs, *self.labels)
+
+    def update(self, chunk):
+        chunk = _as_frame(chunk, self.x, self.y, self.hue)
+        if self._dates is None:
+            self._dates = pd.api.types.is_datetime64_any_dtype(chunk[self.x])
+            if self._dates:
+                self.axe.xaxis_date()
+        if self._dates:
+            xv = mpl.dates.date2num(chunk[self.x].to_numpy())
+        else:
+            xv = chunk[self.x].to_numpy(dtype=np.float64, na_value=np.nan)
+        yv = chunk[self.y].to_numpy(dtype=np.float64, na_value=np.nan)
+        if self.hue is None:
+            codes, levels = np.zeros(len(xv), dtype=np.int64), [None]
+        else:
+            codes, levels = pd.factorize(chunk[self.hue])
+
+        redraw = False
+        for i, level in enumerate(levels):
+            if level not in self.lines:
+                self._add_level(level)
+                redraw = True
+            mask = codes == i
+            self._append(level, xv[mask], yv[mask])
+        redraw = self._rescale(xv, yv) or redraw
+        self._draw(redraw)
+        return self
+
+    def savefig(self, path:str, **kwargs):
+        # Animated lines are skipped by normal draws, so show them while saving
+        for line in self.lines.values():
+            line.set_animated(False)
+        try:
+            self.fig.savefig(path, **kwargs)
+        finally:
+            for line in self.lines.values():
+                line.set_animated(True)
+            # The saving draw baked the lines into the background
+            self._background = None
+
+    def _add_level(self, level):
+        if level not in self.palette:
+            self.palette[level] = self._colors[len(self.lines) % len(self._colors)]
+        label = None if self.hue is None else str(level)
+        self.lines[level], = self.axe.plot([], [], color=self.palette[level], label=label, animated=True)
+        # Each point is written twice, window apart, so the last `window`
+        # points are always one contiguous slice handed to set_data
+        self._buffers[level] = [np.empty(2 * self.window), np.empty(2 * self.window), 0, 0]
+
+    def _append(self, level, xv, yv):
+        xs, ys, end, size = self._buffers[level]
+        xv, yv = xv[-self.window:], yv[-self.window:]
+        idx = (end + np.arange(len(xv))) % self.window
+        for buffer, values in ((xs, xv), (ys, yv)):
+            buffer[idx] = values
+            buffer[idx + self.window] = values
+        end, size = (end + len(xv)) % self.window, min(size + len(xv), self.window)
+        self._buffers[level] = [xs, ys, end, size]
+        start = (end - size) % self.window
+        self.lines[level].set_data(xs[start:start + size], ys[start:start + size])
+
+    def _rescale(self, xv, yv):
+        finite = np.isfinite(xv) & np.isfinite(yv)
+        if not finite.any():
+            return False
+        xv, yv = xv[finite], yv[finite]
+        if self._xlim is not None \
+                and self._xlim[0] <= xv.min() and xv.max() <= self._xlim[1] \
+                and self._ylim[0] <= yv.min() and yv.max() <= self._ylim[1]:
+            return False
+
+        # Fit the whole window, with headroom so the next ticks still fit
+        data = [line.get_data() for line in self.lines.values()]
+        xs = np.concatenate([d[0] for d in data])
+        ys = np.concatenate([d[1] for d in data])
+        finite = np.isfinite(xs) & np.isfinite(ys)
+        xs, ys = xs[finite], ys[finite]
+        xspan = (xs.max() - xs.min()) or 1.0
+        ypad = (ys.max() - ys.min()) * 0.1 or 1.0
+        self._xlim = (xs.min(), xs.max() + xspan * 0.25)
+        self._ylim = (ys.min() - ypad, ys.max() + ypad)
+        self.axe.set_xlim(self._xlim)
+        self.axe.set_ylim(self._ylim)
+        return True
+
+    def _draw(self, full:bool):
+        canvas = self.fig.canvas
+        if full or self._background is None:
+            if self.hue is not None and self.labels[3]:
+                self.axe.legend(handles=list(self.lines.values()))
+                _set_label_layout(self.axe, self.fs, *self.labels)
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            for line in self.lines.values():
+                self.axe.draw_artist(line)
+            canvas.blit(self.axe.bbox)
+        canvas.flush_events()
+
+    def _on_draw(self, event):
+        if event is not None and event.canvas is not self.fig.canvas:
+            return
+        self._background = self.fig.canvas.copy_from_bbox(self.axe.bbox)
+        for line in self.lines.values():
+            self.axe.draw_artist(line)
+
+################
+# Render cache #
+################
+
+class RenderCache:
+    # On-disk image cache keyed by a hash of the data columns a plot reads,
+    # its kwargs, the output format and the library versions; the least
+    # recently used files are evicted once the directory exceeds max_bytes
+    def __init__(self, cache_dir:str, max_bytes:int = 1 << 30):
+        import os
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, plot:str, df, kwargs:Dict, path:str):
+        # None when the data cannot be hashed without consuming it (histplot
+        # chunk iterators and callables); such plots are rendered uncached
+        import hashlib
+        import os
+
+        digest = hashlib.sha1()
+        versions = (plot, __version__, mpl.__version__, sns.__version__, os.path.splitext(path)[1])
+        digest.update(repr(versions).encode())
+        # Output also depends on rcParams such as savefig.dpi and the style
+        rc = sorted((k, v) for k, v in mpl.rcParams.items() if not k.startswith("backend") and k != "interactive")
+        digest.update(repr(rc).encode())
+        columns = [kwargs[k] for k in ("x", "y", "hue") if isinstance(kwargs.get(k), str)]
+        df = _as_frame(df, *columns)
+        if isinstance(df, pd.DataFrame):
+            _hash_value(digest, df[list(dict.fromkeys(columns))] if columns else df)
+        elif isinstance(df, str):
+            stat = os.stat(df)
+            digest.update(repr((os.path.abspath(df), stat.st_size, stat.st_mtime_ns)).encode())
+        elif isinstance(df, np.ndarray):
+            _hash_value(digest, df)
+        elif df is not None:
+            return None
+        for name in sorted(kwargs):
+            digest.update(name.encode())
+            _hash_value(digest, kwargs[name])
+        return digest.hexdigest()
+
+    def fetch(self, key:str, path:str):
+        import os
+        import shutil
+
+        cached = os.path.join(self.cache_dir, key + os.path.splitext(path)[1])
+        try:
+            shutil.copyfile(cached, path)
+            os.utime(cached)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def store(self, key:str, path:str):
+        import os
+        import shutil
+
+        cached = os.path.join(self.cache_dir, key + os.path.splitext(path)[1])
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, cached)
+        self._evict()
+
+    def render(self, plot:str, path:str, df = None, **kwargs):
+        key = self.key(plot, df, kwargs, path)
+        if key is not None and self.fetch(key, path):
+            return True
+        with _record(plot, df, kwargs.get("hue")):
+            fig, _ = globals()[plot](**kwargs) if df is None else globals()[plot](df, **kwargs)
+            with _phase("savefig"):
+                fig.savefig(path)
+        _release_figure(fig)
+        if key is not None:
+            self.store(key, path)
+        return False
+
+    def stats(self):
+        entries = self._entries()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+        }
+
+    def _entries(self):
+        import os
+
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        import os
+
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, file in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(file)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+def _hash_value(digest, value):
+    value = _as_frame(value)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        names = list(value.columns) if isinstance(value, pd.DataFrame) else value.name
+        digest.update(repr(names).encode())
+    elif isinstance(value, np.ndarray):
+        digest.update(repr((value.dtype.str, value.shape)).encode())
+        # .data hashes a contiguous array or memmap in place instead of copying it to bytes
+        digest.update(np.ascontiguousarray(value).data if value.dtype != object else repr(value.tolist()).encode())
+    elif isinstance(value, dict):
+        for k in sorted(value, key=repr):
+            digest.update(repr(k).encode())
+            _hash_value(digest, value[k])
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}{len(value)}".encode())
+        for item in value:
+            _hash_value(digest, item)
+    else:
+        digest.update(repr(value).encode())
+
+################
+# Batch render #
+################
+
+_BATCH_PLOTS = (
+    "featureplot", "heatmap", "scatterplot", "lineplot", "stripplot",
+    "violinplot", "boxplot", "histplot", "pieplot", "barplot",
+)
+_BATCH_DF = None
+_BATCH_CACHE = None
+_BATCH_INSTRUMENTED = None
+
+def render_batch(
+        df:pd.DataFrame,
+        specs:List[Dict],
+        processes:int = None,
+        dpi:int = 100,
+        cache:RenderCache = None,
+    ):
+    # Each spec is a dict with "plot" (function name), "path" (output file)
+    # and the remaining keyword arguments of that plot function.
+    for spec in specs:
+        if spec.get("plot") not in _BATCH_PLOTS:
+            raise ValueError(f"unknown plot {spec.get('plot')!r}, expected one of {_BATCH_PLOTS}")
+        if "path" not in spec:
+            raise ValueError(f"spec for {spec['plot']!r} has no output path")
+
+    ctx = _pool_context()
+    # None when not instrumenting, else whether to trace memory as well
+    import tracemalloc
+    instrumented = None if _RECORDS is None else tracemalloc.is_tracing()
+    initargs = (df, dpi, cache, instrumented)
+    with ctx.Pool(processes, initializer=_init_batch_worker, initargs=initargs) as pool:
+        results = pool.map(_render_spec, specs, chunksize=1)
+
+    for result in results:
+        records = result.pop("records", [])
+        if instrumented is not None:
+            _RECORDS.extend(records)
+
+    # Workers count on their own copies of the cache; fold them back in
+    if cache is not None:
+        hits = sum(r["cached"] for r in results)
+        cache.hits += hits
+        cache.misses += len(results) - hits
+    return results
+
+def _pool_context():
+    import multiprocessing
+    # On Linux fork lets workers inherit the frame and the already imported
+    # backends instead of unpickling a copy and re-importing seaborn in every
+    # process. Elsewhere fork is unsafe (macOS) or missing, so use the
+    # platform's default and let initargs carry the frame
+    if sys.platform.startswith("linux"):
+        sns._load()
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+def _init_batch_worker(df, dpi, cache=None, instrumented=None):
+    global _BATCH_DF, _BATCH_CACHE, _BATCH_INSTRUMENTED, _RECORDS
+    # A forked worker inherits the parent's instrument() state; start clean
+    _RECORDS = None
+    mpl.use("Agg", force=True)
+    mpl.rcParams['savefig.dpi'] = dpi
+    _BATCH_DF = df
+    _BATCH_CACHE = cache
+    _BATCH_INSTRUMENTED = instrumented
+
+def _render_spec(spec:Dict):
+    # Workers ship their instrumentation records back with the result
+    if _BATCH_INSTRUMENTED is not None and _RECORDS is None:
+        with instrument(memory=_BATCH_INSTRUMENTED) as records:
+            result = _render_spec(spec)
+        result["records"] = records
+        return result
+
+    import time
+
+    kwargs = dict(spec)
+    plot, path = kwargs.pop("plot"), kwargs.pop("path")
+    func = globals()[plot]
+
+    df = None if plot == "featureplot" else _BATCH_DF
+
+    start = time.perf_counter()
+    key = None if _BATCH_CACHE is None else _BATCH_CACHE.key(plot, df, kwargs, path)
+    if key is not None:
+        if _BATCH_CACHE.fetch(key, path):
+            total = time.perf_counter() - start
+            return {"plot": plot, "path": path, "draw": 0.0, "save": 0.0, "total": total, "cached": True}
+
+    with _record(plot, df, kwargs.get("hue")):
+        if df is None:
+            fig, _ = func(**kwargs)
+        else:
+            fig, _ = func(df, **kwargs)
+        drawn = time.perf_counter()
+        with _phase("savefig"):
+            fig.savefig(path)
+    _release_figure(fig)
+    if key is not None:
+        _BATCH_CACHE.store(key, path)
+    saved = time.perf_counter()
+
+    return {
+        "plot": plot,
+        "path": path,
+        "draw": drawn - start,
+        "save": saved - drawn,
+        "total": saved - start,
+        "cached": False,
+    }
+
+def render_grid(
+        df:pd.DataFrame,
+        panels:List[Dict],
+        nrow:int,
+        ncol:int,
+        figsize:Tuple[int] = (10, 6),
+        path:str = None,
+        processes:int = None,
+        dpi:int = 100,
+    ):
+    # Compose an nrow x ncol dashboard from render_batch-style specs without
+    # "path" (None leaves a panel empty), in row-major order. Each panel is
+    # drawn on its own figure in a worker and the RGBA buffers are stitched
+    # into one image, which is returned and saved to `path` if given.
+    if len(panels) > nrow * ncol:
+        raise ValueError(f"{len(panels)} panels do not fit a {nrow}x{ncol} grid")
+    for spec in panels:
+        if spec is not None and spec.get("plot") not in _BATCH_PLOTS:
+            raise ValueError(f"unknown plot {spec.get('plot')!r}, expected one of {_BATCH_PLOTS}")
+
+    height, width = round(figsize[1] / nrow * dpi), round(figsize[0] / ncol * dpi)
+    # Panels keep the font sizes they would get in a baseplot(nrow, ncol) grid
+    fs = _get_fontsize(figsize, nrow, ncol)
+    jobs = [
+        (spec, (figsize[0] / ncol, figsize[1] / nrow), fs, dpi)
+        for spec in panels if spec is not None
+    ]
+
+    ctx = _pool_context()
+    import tracemalloc
+    instrumented = None if _RECORDS is None else tracemalloc.is_tracing()
+    initargs = (df, dpi, None, instrumented)
+    with ctx.Pool(processes, initializer=_init_batch_worker, initargs=initargs) as pool:
+        tiles = iter(pool.map(_render_panel, jobs, chunksize=1))
+
+    image = np.full((nrow * height, ncol * width, 4), 255, dtype=np.uint8)
+    for i, spec in enumerate(panels):
+        if spec is None:
+            continue
+        tile, records = next(tiles)
+        if instrumented is not None:
+            _RECORDS.extend(records)
+        tile = tile[:height, :width]
+        row, col = divmod(i, ncol)
+        image[row * height:row * height + tile.shape[0], col * width:col * width + tile.shape[1]] = tile
+
+    if path is not None:
+        mpl.image.imsave(path, image, dpi=dpi)
+    return image
+
+def _render_panel(job):
+    spec, panelsize, fs, dpi = job
+    if _BATCH_INSTRUMENTED is not None and _RECORDS is None:
+        with instrument(memory=_BATCH_INSTRUMENTED) as records:
+            tile, _ = _render_panel(job)
+        return tile, records
+
+    kwargs = dict(spec)
+    plot = kwargs.pop("plot")
+    df = None if plot == "featureplot" else _BATCH_DF
+
+    fig, axe, _ = _get_baseplot(panelsize)
+    fig.set_dpi(dpi)
+    axe.set_facecolor("#F0F0F0")
+    with _record(plot, df, kwargs.get("hue")):
+        if df is None:
+            globals()[plot](fig=fig, axe=axe, fs=fs, **kwargs)
+        else:
+            globals()[plot](df, fig=fig, axe=axe, fs=fs, **kwargs)
+        with _phase("rasterize"):
+            fig.canvas.draw()
+            tile = np.asarray(fig.canvas.buffer_rgba()).copy()
+    _release_figure(fig)
+    return tile, []
+
+###############
+# Figure pool #
+###############
+
+# Live figures reused by _get_baseplot, keyed by (figsize, nrow, ncol) in
+# least-recently-used order; None when pooling is off
+_FIGURE_POOL = None
+_FIGURE_POOL_SIZE = 0
+
+def set_figure_pool(maxsize:int = 8):
+    # Reuse figures across plot calls instead of opening a new one each time,
+    # keeping at most `maxsize` alive; 0 closes them all and turns pooling off.
+    # A pooled figure is cleared on its next use, so save it before then
+    from collections import OrderedDict
+    global _FIGURE_POOL, _FIGURE_POOL_SIZE
+
+    if maxsize < 0:
+        raise ValueError(f"maxsize must be >= 0, got {maxsize}")
+    _FIGURE_POOL_SIZE = maxsize
+    if _FIGURE_POOL is None:
+        _FIGURE_POOL = OrderedDict()
+    while len(_FIGURE_POOL) > maxsize:
+        _, (fig, *_) = _FIGURE_POOL.popitem(last=False)
+        plt.close(fig)
+    if maxsize == 0:
+        _FIGURE_POOL = None
+
+def _pooled_figure(figsize:Tuple[int], nrow:int, ncol:int):
+    key = (tuple(figsize), nrow, ncol)
+    entry = _FIGURE_POOL.get(key)
+    if entry is not None and plt.fignum_exists(entry[0].number):
+        _FIGURE_POOL.move_to_end(key)
+        _reset_figure(*entry, figsize)
+        return entry[0], entry[1]
+
+    fig, axe = plt.subplots(nrow, ncol, figsize=figsize)
+    axes = [axe] if nrow * ncol == 1 else axe.flatten()
+    positions = [ax.get_position(original=True) for ax in axes]
+    # Fresh tick settings, since clear() rebuilds ticks from whatever tick_params left
+    ticks = [[(dict(a._major_tick_kw), dict(a._minor_tick_kw)) for a in (ax.xaxis, ax.yaxis)] for ax in axes]
+    _FIGURE_POOL[key] = (fig, axe, positions, ticks)
+    _FIGURE_POOL.move_to_end(key)
+    while len(_FIGURE_POOL) > _FIGURE_POOL_SIZE:
+        _, (evicted, *_) = _FIGURE_POOL.popitem(last=False)
+        plt.close(evicted)
+    return fig, axe
+
+def _reset_figure(fig, axe, positions, ticks, figsize:Tuple[int]):
+    axes = [axe] if isinstance(axe, mpl.axes.Axes) else list(axe.flatten())
+    # Colorbars and twin axes were added by the previous plot
+    for ax in fig.axes:
+        if not any(ax is a for a in axes):
+            ax.remove()
+    for ax, position, tick_kw in zip(axes, positions, ticks):
+        for axis, (major, minor) in zip((ax.xaxis, ax.yaxis), tick_kw):
+            axis._major_tick_kw, axis._minor_tick_kw = dict(major), dict(minor)
+        ax.clear()
+        ax.set_aspect("auto")
+        ax.set_anchor("C")
+        ax.set_position(position)
+        ax.set_in_layout(True)
+        # clear() keeps the frame and spine visibility that pie and heatmap turn off
+        ax.set_frame_on(True)
+        for spine in ax.spines.values():
+            spine.set_visible(True)
+    for artist in [*fig.legends, *fig.texts, *fig.images, *fig.lines, *fig.patches, *fig.artists]:
+        artist.remove()
+    fig._suptitle = fig._supxlabel = fig._supylabel = None
+    fig.set_size_inches(figsize)
+
+def _release_figure(fig):
+    # Close a figure once it is saved, unless the pool will reuse it
+    if _FIGURE_POOL is None or not any(fig is entry[0] for entry in _FIGURE_POOL.values()):
+        plt.close(fig)
+
 #############
 # Utilities #
 #############
@@ -406,8 +1444,65 @@ def _get_colors(num_colors:int = 4):
     np.random.shuffle(_COLORS)
     return np.concatenate([c for c in _COLORS], axis=0)
 
+# Hue levels, palette and codes per (frame, hue column), keyed by id(frame)
+# and dropped by a finalizer when the frame is garbage collected. Only used
+# under pandas copy-on-write (pandas >= 3, or mode.copy_on_write = True)
+_HUE_CACHE = {}
+
+def clear_hue_cache(df:pd.DataFrame = None):
+    # Forget the cached hue metadata of `df` (all frames when None)
+    if df is None:
+        _HUE_CACHE.clear()
+    else:
+        _HUE_CACHE.pop(id(df), None)
+
+def _same_column(a, b):
+    # Whether two Series share their storage: the extension array itself, or
+    # the NumPy buffer behind the per-access wrapper of plain columns
+    x, y = a.array, b.array
+    if x is y:
+        return True
+    if isinstance(x, pd.arrays.NumpyExtensionArray) and isinstance(y, pd.arrays.NumpyExtensionArray):
+        return np.asarray(x).__array_interface__ == np.asarray(y).__array_interface__
+    return False
+
+def _copy_on_write():
+    # Always on from pandas 3; an option (True / "warn" / False) before that
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+def _hue_entry(df, hue, create:bool = True):
+    import weakref
+    column = df[hue]
+    # Without copy-on-write an in-place edit keeps the column's buffer, so
+    # nothing could tell a stale entry apart; build an uncached one instead
+    if not _copy_on_write():
+        return {"levels": sorted(column.unique())} if create else None
+    entry = _HUE_CACHE.get(id(df), {}).get(hue)
+    # The entry holds the column it was built from, so copy-on-write gives the
+    # frame new storage on any later edit or reassignment of that column
+    if entry is not None and _same_column(entry["column"], column):
+        return entry
+    if not create:
+        return None
+
+    entry = {"column": column, "levels": sorted(column.unique())}
+    if id(df) not in _HUE_CACHE:
+        try:
+            weakref.finalize(df, _HUE_CACHE.pop, id(df), None)
+        except TypeError:
+            return entry
+        _HUE_CACHE[id(df)] = {}
+    _HUE_CACHE[id(df)][hue] = entry
+    return entry
+
+@_timed("palette")
 def _get_palette(df, hue, palette=None):
-    hue_order = sorted(df[hue].unique())
+    entry = _hue_entry(df, hue)
+    hue_order = entry["levels"]
+    if _ACTIVE is not None:
+        _ACTIVE["hue_levels"] = len(hue_order)
     
     if palette is not None:
         palette = [(k,v) for k,v in palette.items() if k in hue_order]
@@ -415,10 +1510,455 @@ def _get_palette(df, hue, palette=None):
         palette = {k:v for k,v in palette}
         return hue_order, palette
 
-    colors = _get_colors(len(hue_order))
-    palette = {h:c for h, c in zip(hue_order, colors)} if palette is None else palette 
+    # Drawn once per frame and column so repeated plots keep their colours
+    if "palette" not in entry:
+        colors = _get_colors(len(hue_order))
+        entry["palette"] = {h:colors[i % len(colors)] for i, h in enumerate(hue_order)}
+    return hue_order, entry["palette"]
+
+def _top_levels(df, x, y, hue, top_n, other="other", palette=None, estimator="sum"):
+    # Keep the top_n x levels ranked by the estimator the plot shows (pie
+    # slices sum y, seaborn bars average it) and relabel the rest `other`.
+    # With "mean" the rows are kept so seaborn averages them (and their error
+    # bars) exactly as without top_n; with "sum" the rest fold into one row.
+    # Levels become strings next to `other`, and so do the palette keys
+    ranked = df.groupby(x, observed=True, sort=False)[y].agg(estimator)
+    if len(ranked) <= top_n:
+        return df, palette
+
+    keep = df[x].isin(ranked.nlargest(top_n).index).to_numpy()
+    df = df[list(dict.fromkeys([x, y, hue]))].copy()
+    for col in dict.fromkeys([x, hue]):
+        df[col] = df[col].astype(str).where(keep, other)
+    if estimator == "sum":
+        rest = pd.DataFrame({x: [other], y: [df.loc[~keep, y].sum()], hue: [other]})
+        df = pd.concat([df[keep], rest[df.columns]], ignore_index=True)
+
+    if palette is not None:
+        palette = {str(k): v for k, v in palette.items()}
+        palette[other] = palette.get(other, "#BBBBBB")
+    return df, palette
+
+def _as_frame(df, *cols):
+    # pyarrow Tables and Polars (Lazy)Frames are narrowed to the columns a plot
+    # reads before converting, so unused columns are never materialized; Arrow
+    # numeric columns without nulls become zero-copy NumPy views. Anything
+    # else, including pandas frames, is returned unchanged
+    module = type(df).__module__.split(".")[0]
+    if module not in ("pyarrow", "polars"):
+        return df
+    cols = list(dict.fromkeys(c for c in cols if c is not None))
+    if cols:
+        df = df.select(cols)
+    if module == "polars":
+        df = df.collect() if type(df).__name__ == "LazyFrame" else df
+        df = df.to_arrow()
+    return df.to_pandas(split_blocks=True)
+
+def _get_features(feature_name, feature_value=None):
+    # Accept (names, values), a dict or Series of name -> value, or a fitted
+    # model exposing feature_importances_ as feature_value
+    if isinstance(feature_name, dict):
+        values = np.fromiter(feature_name.values(), dtype=np.float64, count=len(feature_name))
+        return np.array(list(feature_name), dtype=str), values
+    if isinstance(feature_name, pd.Series):
+        return feature_name.index.to_numpy().astype(str), feature_name.to_numpy(dtype=np.float64)
+    if hasattr(feature_value, "feature_importances_"):
+        feature_value = feature_value.feature_importances_
+    if feature_value is None:
+        feature_value, feature_name = feature_name, np.arange(len(feature_name))
+    return np.asarray(feature_name).astype(str), np.asarray(feature_value, dtype=np.float64).ravel()
+
+def _get_codes(df, hue, hue_order, start=None, stop=None):
+    if hue is None:
+        return np.zeros(len(df.iloc[start:stop]), dtype=np.int64)
+    # Reuse the codes only for a frame _get_palette has already seen
+    entry = _hue_entry(df, hue, create=False)
+    if entry is None or (hue_order is not entry["levels"] and list(hue_order) != entry["levels"]):
+        values = df[hue].iloc[start:stop]
+        return pd.Categorical(values, categories=hue_order).codes.astype(np.int64)
+    # Categorical codes are int8 for up to 127 levels, so caching them for
+    # the whole column costs far less than rescanning it on every chunk
+    if "codes" not in entry:
+        entry["codes"] = pd.Categorical(df[hue], categories=hue_order).codes
+    return entry["codes"][start:stop].astype(np.int64)
+
+def _bin2d(df, x, y, hue, hue_order, colors, extent, gridsize):
+    # Point counts per cell plus the count-weighted sum of each point's hue
+    # colour, so memory is a few gridsize x gridsize arrays whatever the hue
+    # cardinality; also returns which hue levels have any point on the grid
+    ncodes = 1 if hue is None else len(hue_order)
+    size = gridsize * gridsize
+    counts = np.zeros(size, dtype=np.uint32)
+    rgb = np.zeros((3, size), dtype=np.float32)
+    present = np.zeros(ncodes, dtype=bool)
+    xmin, xmax, ymin, ymax = extent
+    xscale = gridsize / (xmax - xmin) if xmax > xmin else 0.0
+    yscale = gridsize / (ymax - ymin) if ymax > ymin else 0.0
+
+    for start in range(0, len(df), _CHUNK_ROWS):
+        stop = start + _CHUNK_ROWS
+        xv = df[x].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+        yv = df[y].iloc[start:stop].to_numpy(dtype=np.float64, na_value=np.nan)
+        codes = _get_codes(df, hue, hue_order, start, stop)
+        valid = np.isfinite(xv) & np.isfinite(yv) & (codes >= 0)
+        codes = codes[valid]
+
+        ix = np.minimum(((xv[valid] - xmin) * xscale).astype(np.int64), gridsize - 1)
+        iy = np.minimum(((yv[valid] - ymin) * yscale).astype(np.int64), gridsize - 1)
+        cell = iy * gridsize + ix
+        counts += np.bincount(cell, minlength=size).astype(np.uint32)
+        for c in range(3):
+            rgb[c] += np.bincount(cell, weights=colors[codes, c], minlength=size)
+        present |= np.bincount(codes, minlength=ncodes) > 0
+    return counts.reshape(gridsize, gridsize), rgb.reshape(3, gridsize, gridsize), present
+
+def _draw_density(axe, df, x, y, hue, hue_order, palette, gridsize):
+    from matplotlib.lines import Line2D
+
+    extent = (df[x].min(), df[x].max(), df[y].min(), df[y].max())
+    levels = [None] if hue is None else hue_order
+    colors = np.array([mpl.colors.to_rgb("#1A2A80" if level is None else palette[level]) for level in levels])
+    counts, rgb, present = _bin2d(df, x, y, hue, hue_order, colors, extent, gridsize)
+    if counts.max() == 0:
+        return axe
+
+    # One composite image: each cell takes the count-weighted mix of its
+    # levels' colours, with alpha from log counts
+    image = np.empty(counts.shape + (4,), dtype=np.float32)
+    image[..., :3] = np.moveaxis(rgb / np.maximum(counts, 1), 0, -1)
+    image[..., 3] = np.log1p(counts) / np.log1p(counts.max())
+    axe.imshow(
+        image,
+        extent=extent,
+        origin="lower",
+        aspect="auto",
+        interpolation="nearest",
+    )
+
+    if hue is not None:
+        handles = [
+            Line2D([], [], marker="o", linestyle="", color=color, label=level)
+            for level, color, seen in zip(levels, colors, present) if seen
+        ]
+        axe.legend(handles=handles)
+    return axe
+
+def _solve_linefit(stats):
+    n, sx, sy, sxy, sxx = np.asarray(stats, dtype=np.float64).T
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = n * sxx - sx * sx
+        slope = np.where((n > 1) & (denom != 0), (n * sxy - sx * sy) / denom, np.nan)
+        intercept = (sy - slope * sx) / n
+    return slope, intercept
+
+@lru_cache(maxsize=None)
+def _get_font():
+    from matplotlib import font_manager
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    for font in _FONTS:
+        if font in installed:
+            return font
+    return None
+
+def _stream_histogram(chunks, x, hue, bins, binrange):
+    if np.ndim(bins) == 0 and binrange is None:
+        if not callable(chunks):
+            raise ValueError("binrange is required for a one-shot iterator of chunks")
+        lo, hi = np.inf, -np.inf
+        for chunk in chunks():
+            chunk = _as_frame(chunk, x)
+            lo, hi = min(lo, chunk[x].min()), max(hi, chunk[x].max())
+        binrange = (lo, hi)
+    if np.ndim(bins) == 0:
+        edges = np.linspace(binrange[0], binrange[1], int(bins) + 1)
+    else:
+        edges = np.asarray(bins, dtype=np.float64)
+    nbins = len(edges) - 1
+
+    counts = {}
+    for chunk in (chunks() if callable(chunks) else chunks):
+        chunk = _as_frame(chunk, x, hue)
+        values = chunk[x].to_numpy(dtype=np.float64, na_value=np.nan)
+        if hue is None:
+            codes, levels = np.zeros(len(values), dtype=np.int64), [None]
+        else:
+            codes, levels = pd.factorize(chunk[hue])
+
+        idx = np.searchsorted(edges, values, side="right") - 1
+        idx[values == edges[-1]] = nbins - 1
+        valid = (idx >= 0) & (idx < nbins) & (codes >= 0)
+        flat = np.bincount(codes[valid] * nbins + idx[valid], minlength=len(levels) * nbins)
+        for level, count in zip(levels, flat.reshape(len(levels), nbins)):
+            counts[level] = counts[level] + count if level in counts else count
+    return edges, counts
+
+def _draw_histogram(axe, edges, counts, hue, palette=None):
+    if hue is None:
+        hue_order, palette = [None], {None: "#1A2A80"}
+    else:
+        hue_order, palette = _get_palette(pd.DataFrame({hue: list(counts)}), hue, palette)
+
+    for level in hue_order:
+        axe.stairs(
+            counts[level],
+            edges,
+            fill=True,
+            alpha=0.5,
+            color=palette[level],
+            label=level,
+        )
+    if hue is not None:
+        axe.legend()
     return hue_order, palette
 
+def _kde_fft(values, weights=None, gridsize=512, bw_adjust=1, cut=3):
+    # Gaussian KDE with Scott's bandwidth: linear-bin the samples onto a
+    # regular grid and convolve with the sampled kernel via FFT, which is
+    # O(n + g log g) instead of O(n * g) for the exact sum
+    values = np.asarray(values, dtype=np.float64)
+    weights = np.ones_like(values) if weights is None else np.asarray(weights, dtype=np.float64)
+    valid = np.isfinite(values) & (weights > 0)
+    values, weights = values[valid], weights[valid]
+
+    total = weights.sum()
+    mean = np.average(values, weights=weights)
+    var = np.average((values - mean) ** 2, weights=weights) * total / max(total - 1, 1)
+    bw = np.sqrt(var) * total ** (-1 / 5) * bw_adjust
+    if not bw > 0:
+        bw = 1.0
+
+    grid = np.linspace(values.min() - cut * bw, values.max() + cut * bw, gridsize)
+    delta = grid[1] - grid[0]
+
+    pos = (values - grid[0]) / delta
+    left = np.minimum(pos.astype(np.int64), gridsize - 2)
+    frac = pos - left
+    binned = np.bincount(left, weights=weights * (1 - frac), minlength=gridsize)
+    binned += np.bincount(left + 1, weights=weights * frac, minlength=gridsize)
+
+    reach = min(gridsize - 1, int(np.ceil(4 * bw / delta)))
+    offsets = np.arange(-reach, reach + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bw) ** 2) / (np.sqrt(2 * np.pi) * bw)
+
+    size = 1 << int(np.ceil(np.log2(gridsize + 2 * reach + 1)))
+    smoothed = np.fft.irfft(np.fft.rfft(binned, size) * np.fft.rfft(kernel, size), size)
+    density = smoothed[reach:reach + gridsize] / total
+    return grid, np.maximum(density, 0)
+
+def _draw_violins(axe, df, x, y, hue, hue_order, palette, width=0.5):
+    from matplotlib.patches import Patch
+
+    order = pd.unique(df[x].dropna())
+    if pd.api.types.is_numeric_dtype(df[x]):
+        order = np.sort(order)
+    positions = pd.Categorical(df[x], categories=order).codes
+    codes = _get_codes(df, hue, hue_order)
+    values = df[y].to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = np.isfinite(values) & (positions >= 0) & (codes >= 0)
+
+    violins = []
+    for i in range(len(order)):
+        for k in range(1 if hue is None else len(hue_order)):
+            group = values[valid & (positions == i) & (codes == k)]
+            if len(group) < 2:
+                continue
+            grid, density = _kde_fft(group, cut=2)
+            color = "#1A2A80" if hue is None else palette[hue_order[k]]
+            violins.append((i, group, grid, density, color))
+
+    # Same area for every violin, widest one filling the slot
+    peak = max((v[3].max() for v in violins), default=1)
+    for i, group, grid, density, color in violins:
+        half = density / peak * width / 2
+        axe.fill_betweenx(grid, i - half, i + half, color=color, edgecolor="#333333", linewidth=0.5)
+
+        q1, median, q3 = np.percentile(group, [25, 50, 75])
+        iqr = q3 - q1
+        lo = group[group >= q1 - 1.5 * iqr].min()
+        hi = group[group <= q3 + 1.5 * iqr].max()
+        axe.vlines(i, lo, hi, color="#333333", linewidth=1)
+        axe.vlines(i, q1, q3, color="#333333", linewidth=4)
+        axe.scatter([i], [median], color="white", s=10, zorder=3)
+
+    axe.set_xticks(range(len(order)), labels=order)
+    if hue is not None:
+        axe.legend(handles=[Patch(color=palette[h], label=h) for h in hue_order])
+    return axe
+
+def _sketch_to_bxp(label, sketch:QuantileSketch):
+    q1, med, q3 = sketch.quantile([0.25, 0.5, 0.75])
+    iqr = q3 - q1
+    return {
+        "label": label,
+        "q1": q1,
+        "med": med,
+        "q3": q3,
+        "whislo": max(sketch.min, q1 - 1.5 * iqr),
+        "whishi": min(sketch.max, q3 + 1.5 * iqr),
+        "fliers": [],
+    }
+
+def _draw_bxp(axe, stats, hue, palette=None):
+    labels = sorted(stats)
+    boxes = []
+    for label in labels:
+        box = stats[label]
+        if isinstance(box, QuantileSketch):
+            box = _sketch_to_bxp(label, box)
+        boxes.append({"label": label, "fliers": [], **box})
+
+    _, palette = _get_palette(pd.DataFrame({hue: labels}), hue, palette)
+    artists = axe.bxp(
+        boxes,
+        positions=range(len(boxes)),
+        widths=0.5,
+        patch_artist=True,
+        showfliers=False,
+        boxprops=dict(linewidth=0.5),
+        medianprops=dict(color="#333333", linewidth=0.5),
+    )
+    for patch, label in zip(artists["boxes"], labels):
+        patch.set_facecolor(palette[label])
+    return axe
+
+def _as_float(series):
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.astype("int64")
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
+
+def _lttb(xv, yv, n_out):
+    # Largest-Triangle-Three-Buckets on x-sorted arrays; returns kept indices
+    n = len(xv)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    starts = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    sizes = np.diff(np.r_[starts, n])
+    xmean = np.add.reduceat(xv, starts) / sizes
+    ymean = np.add.reduceat(yv, starts) / sizes
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = starts[i], starts[i + 1]
+        area = np.abs(
+            (xv[a] - xmean[i + 1]) * (yv[lo:hi] - yv[a])
+            - (xv[a] - xv[lo:hi]) * (ymean[i + 1] - yv[a])
+        )
+        a = lo + np.argmax(area)
+        selected[i + 1] = a
+    return selected
+
+def _minmax(yv, n_out):
+    # First/last point plus the min and max of each of n_out // 2 buckets;
+    # linspace bounds keep every bucket non-empty and inside [0, n)
+    n = len(yv)
+    nbuckets = max(n_out // 2, 1)
+    if n_out >= n:
+        return np.arange(n)
+    starts = np.linspace(0, n, nbuckets + 1).astype(np.int64)[:-1]
+    bucket = np.repeat(np.arange(nbuckets), np.diff(np.r_[starts, n]))
+    picked = [[0, n - 1]]
+    for reduce in (np.minimum, np.maximum):
+        # First index in each bucket that attains the bucket's extreme
+        hits = np.flatnonzero(yv == reduce.reduceat(yv, starts)[bucket])
+        picked.append(hits[np.unique(bucket[hits], return_index=True)[1]])
+    return np.unique(np.concatenate(picked))
+
+def _downsample_series(df, x, y, hue, hue_order, n_out, method="lttb"):
+    if method not in ("lttb", "minmax"):
+        raise ValueError(f"downsample_method must be 'lttb' or 'minmax', got {method!r}")
+    xv, yv = _as_float(df[x]), _as_float(df[y])
+    codes = _get_codes(df, hue, hue_order)
+    valid = np.flatnonzero(np.isfinite(xv) & np.isfinite(yv) & (codes >= 0))
+
+    order = valid[np.lexsort((xv[valid], codes[valid]))]
+    sorted_codes = codes[order]
+    bounds = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1], True])
+
+    keep = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        group = order[lo:hi]
+        if method == "lttb":
+            picked = _lttb(xv[group], yv[group], n_out)
+        else:
+            picked = _minmax(yv[group], n_out)
+        keep.append(group[picked])
+    return df.iloc[np.sort(np.concatenate(keep))] if keep else df.iloc[:0]
+
+def _pool_matrix(matrix, maxcells, pooling="mean", order=None, budget=1 << 22):
+    import warnings
+
+    nrow, ncol = matrix.shape
+    fy, fx = -(-nrow // maxcells), -(-ncol // maxcells)
+    out_rows, out_cols = -(-nrow // fy), -(-ncol // fx)
+    reduce = {"mean": np.nanmean, "max": np.nanmax}[pooling]
+
+    # Read whole output rows at a time, as many as fit in the element budget
+    step = max(1, budget // (fy * ncol))
+    pooled = np.empty((out_rows, out_cols))
+    for out_start in range(0, out_rows, step):
+        out_stop = min(out_start + step, out_rows)
+        if order is None:
+            block = np.asarray(matrix[out_start * fy:out_stop * fy], dtype=np.float64)
+        else:
+            rows = order[out_start * fy:out_stop * fy]
+            block = np.asarray(matrix[rows], dtype=np.float64)[:, order]
+
+        padded = np.full(((out_stop - out_start) * fy, out_cols * fx), np.nan)
+        padded[:block.shape[0], :ncol] = block
+        padded = padded.reshape(out_stop - out_start, fy, out_cols, fx)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            pooled[out_start:out_stop] = reduce(padded, axis=(1, 3))
+    return pooled, fy, fx
+
+def _draw_pooled_heatmap(fig, axe, df, maxcells, pooling="mean", order=None, maxticks=10):
+    if pooling not in ("mean", "max"):
+        raise ValueError(f"pooling must be 'mean' or 'max', got {pooling!r}")
+    matrix = df.to_numpy() if isinstance(df, pd.DataFrame) else df
+    order = None if order is None else np.asarray(order)
+    pooled, fy, fx = _pool_matrix(matrix, maxcells, pooling, order)
+
+    image = axe.imshow(
+        pooled,
+        aspect="auto",
+        interpolation="nearest",
+        cmap=sns.color_palette("rocket", as_cmap=True),
+        rasterized=True,
+    )
+    fig.colorbar(image, ax=axe)
+
+    for size, factor, labels, set_ticks in (
+            (pooled.shape[0], fy, getattr(df, "index", None), axe.set_yticks),
+            (pooled.shape[1], fx, getattr(df, "columns", None), axe.set_xticks),
+        ):
+        ticks = np.arange(0, size, -(-size // maxticks))
+        index = ticks * factor if order is None else order[ticks * factor]
+        names = index if labels is None else labels[index]
+        set_ticks(ticks, labels=[str(name) for name in names])
+    axe.tick_params(axis='x', rotation=90)
+    axe.grid(False)
+    return axe
+
+def _sample_groups(df, keys, max_points, seed=0):
+    # Uniform sample of at most max_points rows per group: order rows by a
+    # random priority within each group and keep the first max_points, which
+    # is what a per-group reservoir would hold. Small groups keep every row.
+    if max_points is None or len(df) <= max_points:
+        return df
+    keys = list(dict.fromkeys(k for k in keys if k is not None))
+    codes = df.groupby(keys, sort=False, observed=True, dropna=False).ngroup().to_numpy()
+    priority = np.random.default_rng(seed).random(len(df))
+
+    order = np.lexsort((priority, codes))
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(order)])
+    rank = np.arange(len(order)) - np.repeat(starts, sizes)
+    return df.iloc[np.sort(order[rank < max_points])]
+
 def _get_fontsize(figsize, nrow, ncol):
     minsize = min(int(figsize[0] / ncol), int(figsize[1] / nrow))
     scale = minsize * minsize / 40
@@ -427,6 +1967,7 @@ def _get_fontsize(figsize, nrow, ncol):
         "label": round(20 * scale, 1),
         "tick": round(15 * scale, 1)}
 
+@_timed("baseplot")
 def _get_baseplot(
         figsize:Tuple[int] = (10, 6),
         fig = None,
@@ -438,7 +1979,10 @@ def _get_baseplot(
     if fig is not None and axe is not None and fs is not None:
         return fig, axe, fs
     
-    fig, axe = plt.subplots(nrow, ncol, figsize=figsize)
+    if _FIGURE_POOL is not None:
+        fig, axe = _pooled_figure(figsize, nrow, ncol)
+    else:
+        fig, axe = plt.subplots(nrow, ncol, figsize=figsize)
     fs = _get_fontsize(figsize, nrow, ncol)
 
     if nrow * ncol == 1:
@@ -448,6 +1992,7 @@ def _get_baseplot(
             ax.set_facecolor("#F0F0F0")
     return fig, axe, fs
 
+@_timed("layout")
 def _set_label_layout(
         axe,
         fs:Dict[str, int],
@@ -3,57 +3,75 @@ import seaborn as sns
 
 import pandas as pd
 
-def barplot(df, colname):
-    fig, axe = plt.subplots(1, 2, figsize=(10,3))
-    df[colname] = df[colname].astype(str)
-    unique_vals = df[colname].dropna().unique()
-    colors = sns.color_palette("Set2", len(unique_vals))
-    palette = dict(zip(sorted(unique_vals), colors))
-
-    for i, label in enumerate(["적합", "부적합"]):
-        grouped= df[df["평가결과"]==label].groupby([colname])[["평가결과", "인증번호"]].count().reset_index()
+try:  # 저장소 루트에서 패키지로 import (references.xxx)
+    from .facets import crosstab, histogram, pivot_sum
+except ImportError:  # references/ 에서 직접 실행
+    from facets import crosstab, histogram, pivot_sum
+
+LABELS = ("적합", "부적합")
+
+def barplot(df, colname, label_col="평가결과", labels=LABELS, count_col="인증번호"):
+    fig, axe = plt.subplots(1, len(labels), figsize=(5 * len(labels), 3), squeeze=False)
+    axe = axe[0]  # 라벨이 하나여도 axe[i]로 접근
+    levels, rows, table = crosstab(df, colname, label_col, labels, count_col, dropna=False)
+    colors = sns.color_palette("Set2", len(levels))
+    palette = dict(zip(levels, colors))
+
+    for i, label in enumerate(labels):
+        present = rows[i] > 0
+        grouped = pd.DataFrame({
+            colname: levels[present],
+            "인증번호": table[i][present],
+        })
         sns.barplot(data=grouped, x=colname, y="인증번호", hue=colname, palette=palette, ax=axe[i])
         axe[i].set_xticks(grouped[colname].values)
         if (type(grouped[colname][0])==type("str") and max([len(c) for c in grouped[colname].unique()]) >= 6):
             axe[i].tick_params(axis='x', rotation=90)
         axe[i].set_xlabel(colname)
         axe[i].set_ylabel("")
-        axe[i].set_title(f"평가결과: {label}")
+        axe[i].set_title(f"{label_col}: {label}")
     
         if (axe[i].get_legend() and len(grouped[colname].unique())>10):
             axe[i].get_legend().remove()
     plt.show()
     return
 
-def violinplot(df, colname):
+def violinplot(df, colname, label_col="평가결과", labels=LABELS):
     fig, axe = plt.subplots(1, 1, figsize=(10,3))
 
-    sns.violinplot(x="평가결과", y=colname, data=df, hue="평가결과", palette="Set2", order=["적합", "부적합"], hue_order=["적합", "부적합"], ax=axe)
+    sns.violinplot(x=label_col, y=colname, data=df, hue=label_col, palette="Set2", order=list(labels), hue_order=list(labels), ax=axe)
     axe.set_xlabel(colname)
     plt.grid(True)
     plt.show()
     return
 
-def histplot(df, colname):
-    fig, axe = plt.subplots(1, 3, figsize=(15,3))
+def histplot(df, colname, label_col="평가결과", labels=LABELS):
+    fig, axe = plt.subplots(1, len(labels) + 1, figsize=(5 * (len(labels) + 1), 3))
 
-    colors = sns.color_palette("Set2", 2)
-    palette = dict(zip(["적합", "부적합"], colors))
+    colors = sns.color_palette("Set2", len(labels))
+    palette = dict(zip(labels, colors))
+    edges, table = histogram(df, colname, label_col, labels)  # 라벨별 개수 (한 번에)
 
-    for i, label in enumerate(["적합", "부적합"]):
-        grouped = df.loc[df["평가결과"]==label, ["평가결과", colname]]
-        sns.histplot(x=colname, data=grouped, hue="평가결과", palette=palette, ax=axe[i])
+    for i, label in enumerate(labels):
+        axe[i].stairs(table[i], edges, fill=True, alpha=0.5, color=palette[label], label=label)
+        axe[i].stairs(table[i], edges, color=palette[label])
+        axe[i].legend(title=label_col)
         axe[i].set_xlabel(colname)
-        axe[i].set_title(f"평가결과: {label}")
-
-    sns.histplot(x=colname, data=df, hue="평가결과", palette=palette, ax=axe[2])
-    axe[2].set_xlabel(colname)
-    axe[2].set_title(f"적합/부적합 비교")
+        axe[i].set_ylabel("Count")
+        axe[i].set_title(f"{label_col}: {label}")
+
+    for i, label in enumerate(labels):
+        axe[-1].stairs(table[i], edges, fill=True, alpha=0.5, color=palette[label], label=label)
+    axe[-1].legend(title=label_col)
+    axe[-1].set_xlabel(colname)
+    axe[-1].set_ylabel("Count")
+    axe[-1].set_title("/".join(labels) + " 비교")
     plt.show()
     return
 
-def stackedbarplot(df):
-    pivot = df.pivot_table(index="평가대상", columns="평가결과", values="인증번호", aggfunc="sum", fill_value=0)
+def stackedbarplot(df, processes=None):
+    # df: DataFrame 또는 월별 parquet/csv 파티션 경로 목록
+    pivot = pivot_sum(df, "평가대상", "평가결과", "인증번호", processes)
 
     # ▶ 비율로 정규화
     pivot_ratio = pivot.div(pivot.sum(axis=1), axis=0) * 100
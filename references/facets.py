@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+
+def encode(series, dropna=True):
+    # 컬럼을 한 번만 정수 코드로 변환 (원본 df는 수정하지 않음)
+    codes, uniques = pd.factorize(series, use_na_sentinel=dropna)
+    # 고유값만 문자열로 바꿔서 정렬 → 예전 astype(str) 결과와 같은 순서/라벨
+    levels, remap = np.unique(np.asarray(uniques).astype(str), return_inverse=True)
+    codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+    return codes, levels.astype(object)
+
+
+def encode_labels(df, label_col, labels):
+    # 라벨 컬럼을 labels 순서의 코드로 (목록에 없는 값은 -1)
+    return pd.Categorical(df[label_col], categories=list(labels)).codes.astype(np.int64)
+
+
+def crosstab(df, colname, label_col, labels, count_col=None, dropna=True):
+    # 라벨 × 값 개수표를 한 번의 스캔으로 계산
+    # rows: 행 개수, counts: count_col이 비어있지 않은 행 개수 (groupby().count()와 동일)
+    codes, levels = encode(df[colname], dropna=dropna)
+    lab = encode_labels(df, label_col, labels)
+    valid = (codes >= 0) & (lab >= 0)
+    key = lab[valid] * len(levels) + codes[valid]
+    size = len(labels) * len(levels)
+
+    rows = np.bincount(key, minlength=size).reshape(len(labels), len(levels))
+    if count_col is None:
+        return levels, rows, rows
+    weights = df[count_col].notna().to_numpy()[valid]
+    counts = np.bincount(key, weights=weights, minlength=size).astype(np.int64)
+    return levels, rows, counts.reshape(len(labels), len(levels))
+
+
+def histogram(df, colname, label_col, labels, bins="auto"):
+    # 라벨별 히스토그램을 같은 bin 경계로 한 번에 계산
+    values = df[colname].to_numpy(dtype=np.float64, na_value=np.nan)
+    lab = encode_labels(df, label_col, labels)
+    valid = np.isfinite(values) & (lab >= 0)
+    edges = np.histogram_bin_edges(values[valid], bins=bins)
+    nbins = len(edges) - 1
+
+    idx = np.clip(np.searchsorted(edges, values[valid], side="right") - 1, 0, nbins - 1)
+    counts = np.bincount(lab[valid] * nbins + idx, minlength=len(labels) * nbins)
+    return edges, counts.reshape(len(labels), nbins)
+
+
+def _read_partition(path, columns):
+    if str(path).endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns)
+
+
+def _partial_sum(args):
+    # 파티션 하나만 읽어서 (index, columns)별 합계 계산
+    path, index, columns, values = args
+    part = _read_partition(path, [index, columns, values])
+    return part.groupby([index, columns])[values].sum()
+
+
+def pivot_sum(df, index, columns, values, processes=None):
+    # df가 파일 경로 목록이면 파티션별 부분합을 프로세스 풀에서 계산한 뒤 합침
+    # → 메모리에는 파티션 하나씩만 올라감
+    if isinstance(df, pd.DataFrame):
+        return df.pivot_table(index=index, columns=columns, values=values, aggfunc="sum", fill_value=0)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = [(path, index, columns, values) for path in df]
+    with ProcessPoolExecutor(processes) as pool:
+        partials = list(pool.map(_partial_sum, tasks))
+    total = pd.concat(partials).groupby(level=[0, 1]).sum()
+    return total.unstack(fill_value=0)
@@ -0,0 +1,77 @@
+import importlib
+import importlib.util
+import multiprocessing
+import os
+import time
+import warnings
+
+import pandas as pd
+
+# 워커가 fork로 물려받는 DataFrame (pickle 복사 없이 copy-on-write로 공유)
+_FRAME = None
+
+
+def plan(df, target, max_levels=30):
+    # 컬럼 dtype/고유값 수로 그릴 그래프 선택
+    jobs = []
+    for col in df.columns:
+        if col == target:
+            continue
+        series = df[col]
+        if pd.api.types.is_numeric_dtype(series) and series.nunique() > max_levels:
+            jobs += [("histplot", col), ("violinplot", col)]
+        else:
+            jobs.append(("barplot", col))
+    return jobs
+
+
+def _init(df):
+    global _FRAME
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    _FRAME = df
+
+
+def _render(job):
+    import matplotlib.pyplot as plt
+
+    module, plot, col, target, labels, count_col, path = job
+    result = {"column": col, "plot": plot, "path": path, "error": None}
+    start = time.perf_counter()
+    try:
+        with warnings.catch_warnings():
+            # Agg에서는 plt.show()가 아무것도 하지 않으므로 경고만 숨김
+            warnings.simplefilter("ignore", UserWarning)
+            kwargs = {"count_col": count_col} if plot == "barplot" else {}
+            getattr(importlib.import_module(module), plot)(_FRAME, col, label_col=target, labels=labels, **kwargs)
+        plt.gcf().savefig(path, bbox_inches="tight")
+    except Exception as exc:
+        # 컬럼 하나가 실패해도 나머지 프로파일은 계속
+        result["path"], result["error"] = None, repr(exc)
+    finally:
+        plt.close("all")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def profile(df, target, outdir, labels=None, module="eda4_plots", processes=None, max_levels=30, count_col=None):
+    # 전체 컬럼을 그래프 파일로 저장 (프로세스 풀 병렬)
+    # count_col: barplot에서 값이 있는 행만 셀 컬럼 (None이면 행 개수, 예: "업체정보_인증번호")
+    os.makedirs(outdir, exist_ok=True)
+    labels = tuple(sorted(df[target].dropna().unique())) if labels is None else tuple(labels)
+    # references.profiler 로 import 된 경우 같은 폴더의 모듈은 패키지 이름으로 찾음
+    if __package__ and "." not in module and importlib.util.find_spec(f"{__package__}.{module}"):
+        module = f"{__package__}.{module}"
+
+    jobs = []
+    for plot, col in plan(df, target, max_levels):
+        name = str(col).replace("/", "_").replace(os.sep, "_")
+        jobs.append((module, plot, col, target, labels, count_col, os.path.join(outdir, f"{name}_{plot}.png")))
+
+    # fork면 워커가 부모의 df 버퍼와 import된 seaborn을 그대로 공유
+    # (spawn 환경에서는 워커마다 한 번 pickle)
+    importlib.import_module(module)
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+    with ctx.Pool(processes, initializer=_init, initargs=(df,)) as pool:
+        return pool.map(_render, jobs, chunksize=1)